@@ -82,11 +82,14 @@ def webscrape_apartments(link: str, headers: List[str]) -> List[dict]:
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     driver = webdriver.Chrome(ChromeDriverManager().install(), options=chrome_options)
-    driver.get(link)
+    try:
+        driver.get(link)
 
-    load_more_offer(driver)
+        load_more_offer(driver)
 
-    html = driver.page_source
+        html = driver.page_source
+    finally:
+        driver.quit()  # do not leave browser processes behind, e.g. when run repeatedly
     soup = BeautifulSoup(html, 'html.parser')
     apartments = find_apartments(soup, headers)
 
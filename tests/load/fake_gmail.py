@@ -0,0 +1,85 @@
+"""Local sink for e-mails sent with Gmail API
+
+Replaces the Gmail API service built in `my_gmail` with an in-memory one,
+so the whole sending path (message creation, base64 encoding, sending) runs
+without credentials and without touching the network.
+"""
+
+import base64
+import email
+import itertools
+import threading
+import time
+
+from contextlib import contextmanager
+from email.message import Message
+from typing import Iterator, List
+from unittest.mock import patch
+
+
+class FakeGmailService:
+    """Mimics `service.users().messages().send(userId=..., body=...).execute()` chain
+    of the Gmail API client and stores decoded messages instead of sending them
+
+    :param latency: delay in seconds added to every sent message
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.sent = []  # decoded e-mail messages
+        self.send_times = []  # seconds spent on sending every message
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def users(self) -> 'FakeGmailService':
+        return self
+
+    def messages(self) -> 'FakeGmailService':
+        return self
+
+    def send(self, userId: str, body: dict) -> '_FakeRequest':
+        return _FakeRequest(self, body)
+
+    @property
+    def subjects(self) -> List[str]:
+        """Subjects of all sent messages"""
+
+        return [message['subject'] for message in self.sent]
+
+    def _deliver(self, body: dict) -> dict:
+        started = time.perf_counter()
+        if self.latency:
+            time.sleep(self.latency)
+        message = email.message_from_bytes(base64.urlsafe_b64decode(body['raw']))
+        with self._lock:
+            message_id = f'fake-{next(self._ids)}'
+            self.sent.append(message)
+            self.send_times.append(time.perf_counter() - started)
+        return {'id': message_id}
+
+
+class _FakeRequest:
+    """Pending request returned by `FakeGmailService.send`"""
+
+    def __init__(self, service: FakeGmailService, body: dict) -> None:
+        self._service = service
+        self._body = body
+
+    def execute(self) -> dict:
+        return self._service._deliver(self._body)
+
+
+@contextmanager
+def fake_gmail(latency: float = 0.0) -> Iterator[FakeGmailService]:
+    """Patches `my_gmail` to send all e-mails to the returned `FakeGmailService`"""
+
+    service = FakeGmailService(latency)
+    with patch('my_gmail.create_credentials', return_value=None), \
+            patch('my_gmail.build', return_value=service):
+        yield service
+
+
+def message_text(message: Message) -> str:
+    """Returns decoded text of the sent message"""
+
+    return message.get_payload(decode=True).decode(message.get_content_charset() or 'utf-8')
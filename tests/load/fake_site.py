@@ -0,0 +1,284 @@
+"""Local fake of the ForestClub apartments search page
+
+Serves a generated, paginated list of apartments in the same markup as the real website,
+including a working "load more" button, so the scraper can be run against it with
+a real selenium web-driver. Size of the listing, page size, response latency
+and churn of the offer between consecutive runs are configurable.
+"""
+
+import random
+import string
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from typing import List, Optional
+
+_PAGE_TEMPLATE = string.Template('''<!DOCTYPE html>
+<html lang="pl">
+<head>
+    <meta charset="UTF-8">
+    <title>ForestClub - wyszukaj</title>
+</head>
+<body>
+<table id="flats-list" class="table tablesorter" role="grid">
+            <thead>
+            <tr role="row" class="tablesorter-headerRow">
+                <th scope="col">Mieszkanie</th>
+                <th scope="col">METRAŻ</th>
+                <th scope="col">LICZBA POKOI</th>
+                <th scope="col">PIĘTRO</th>
+                <th scope="col">STATUS</th>
+                <th scope="col">KARTA</th>
+                <th scope="col"></th>
+            </tr>
+            </thead>
+            <tbody aria-live="polite" aria-relevant="all">
+$rows
+            </tbody>
+        </table>
+<button class="btn load_more_offer" type="button" style="$button_style">POKAŻ WIĘCEJ</button>
+<script>
+(function () {
+    var button = document.querySelector('button.load_more_offer');
+    var tbody = document.querySelector('#flats-list tbody');
+    var nextPage = 2;
+    var loading = false;
+
+    button.addEventListener('click', function () {
+        // the scraper keeps clicking while the button is visible,
+        // so ignore clicks until the pending page has been appended
+        if (loading) {
+            return;
+        }
+        loading = true;
+        fetch('/flats/?page=' + nextPage).then(function (response) {
+            var lastPage = response.headers.get('X-Last-Page') === '1';
+            return response.text().then(function (rows) {
+                tbody.insertAdjacentHTML('beforeend', rows);
+                nextPage += 1;
+                if (lastPage) {
+                    button.style.display = 'none';
+                }
+                loading = false;
+            });
+        }).catch(function () {
+            loading = false;
+        });
+    });
+})();
+</script>
+</body>
+</html>
+''')
+
+_ROW_TEMPLATE = string.Template('''                                                    <tr class="active" role="row">
+                        <td>$name</td>
+                        <td> $size m²</td>
+                        <td>$rooms</td>
+                        <td>$floor</td>
+                        <td>$status</td>
+                        <td>
+                                                            <a target="_blank" href="$link">
+                                    <i class="fa fa-file-pdf-o" aria-hidden="true"></i>
+                                </a>
+                                                    </td>
+                        <td>
+                                                    </td>
+                    </tr>
+''')
+
+
+def _rooms_label(rooms: int) -> str:
+    """Returns number of rooms in the format used by the website"""
+
+    if rooms == 1:
+        return '1 pokój'
+    if rooms < 5:
+        return f'{rooms} pokoje'
+    return f'{rooms} pokoi'
+
+
+def _floor_label(floor: int) -> str:
+    """Returns floor in the format used by the website"""
+
+    if floor == 0:
+        return 'parter'
+    return f'piętro {floor}'
+
+
+class FakeForestClub:
+    """Generates the offer of apartments and serves it over HTTP on localhost
+
+    :param flats: number of apartments generated for the first run
+    :param page_size: number of apartments shown per page (per "load more" click)
+    :param latency: delay in seconds added to every response
+    :param churn: fraction of apartments changing their status on each `advance()`
+    :param growth: number of new apartments put on the market on each `advance()`
+    :param seed: seed of the random generator, makes the offer reproducible
+    """
+
+    def __init__(self, flats: int = 100, page_size: int = 20, latency: float = 0.0,
+                 churn: float = 0.05, growth: int = 0, seed: Optional[int] = None) -> None:
+        assert page_size > 0, 'Page size must be positive!'
+        assert 0.0 <= churn <= 1.0, 'Churn must be a fraction between 0 and 1!'
+
+        self.page_size = page_size
+        self.latency = latency
+        self.churn = churn
+        self.growth = growth
+        self.requests = []  # (path, seconds) of every served request
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._flats = []
+        self._server = None
+        self._thread = None
+        self._add_flats(flats)
+
+    @property
+    def link(self) -> str:
+        """Search link of the fake website, equivalent of `forestclub._LINK`"""
+
+        return f'{self.url}/wyszukaj/?flat-type=Mieszkanie&area=&room=&floor=#flats-list'
+
+    @property
+    def url(self) -> str:
+        """Base url of the running server"""
+
+        assert self._server is not None, 'Fake site is not running!'
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def pages(self) -> int:
+        """Number of pages needed to show the whole offer"""
+
+        return max(1, -(-len(self._flats) // self.page_size))
+
+    def apartments(self) -> List[dict]:
+        """Returns the current offer in the format produced by `forestclub.find_apartments`"""
+
+        with self._lock:
+            return [{
+                'Apartment': flat['name'],
+                'Size': flat['size'],
+                'Rooms': str(flat['rooms']),
+                'Floor': str(flat['floor']),
+                'Status': 'free' if flat['free'] else 'sold',
+                'Link': self._pdf_link(flat['name']),
+            } for flat in self._flats]
+
+    def advance(self) -> None:
+        """Simulates changes of the offer between two runs of the scraper"""
+
+        with self._lock:
+            changed = self._random.sample(self._flats, round(self.churn * len(self._flats)))
+            for flat in changed:
+                flat['free'] = not flat['free']
+        self._add_flats(self.growth)
+
+    def render_page(self) -> str:
+        """Returns the search page with the first page of apartments"""
+
+        hidden = '' if self.pages > 1 else 'display: none;'
+        return _PAGE_TEMPLATE.substitute(rows=self.render_rows(1), button_style=hidden)
+
+    def render_rows(self, page: int) -> str:
+        """Returns table rows of apartments shown on a given page (counted from 1)"""
+
+        start = (page - 1) * self.page_size
+        with self._lock:
+            flats = self._flats[start:start + self.page_size]
+        return ''.join(_ROW_TEMPLATE.substitute(
+            name=flat['name'],
+            size=flat['size'],
+            rooms=_rooms_label(flat['rooms']),
+            floor=_floor_label(flat['floor']),
+            status='wolne' if flat['free'] else 'sprzedane',
+            link=self._pdf_link(flat['name']),
+        ) for flat in flats)
+
+    def start(self) -> 'FakeForestClub':
+        """Starts the HTTP server on a free local port in a background thread"""
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeForestClubHandler)
+        self._server.daemon_threads = True
+        self._server.site = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the HTTP server"""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> 'FakeForestClub':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _add_flats(self, count: int) -> None:
+        """Appends new apartments, numbered consecutively within a floor of building A"""
+
+        with self._lock:
+            for _ in range(count):
+                index = len(self._flats)
+                floor = index % 6
+                number = index // 6 + 1
+                self._flats.append({
+                    'name': f'A.{floor}.{number:02d}',
+                    'size': f'{self._random.uniform(30, 110):.2f}'.rstrip('0').rstrip('.'),
+                    'rooms': self._random.randint(1, 5),
+                    'floor': floor,
+                    'free': self._random.random() < 0.3,
+                })
+
+    def _pdf_link(self, name: str) -> str:
+        return f'https://www.forestclub.com.pl/wp-content/uploads/2019/04/{name}.pdf'
+
+
+class _FakeForestClubHandler(BaseHTTPRequestHandler):
+    """Serves the search page and subsequent pages of apartments for the "load more" button"""
+
+    def do_GET(self) -> None:
+        site = self.server.site
+        started = time.perf_counter()
+        if site.latency:
+            time.sleep(site.latency)
+
+        url = urlparse(self.path)
+        headers = {}
+        if url.path == '/wyszukaj/':
+            body = site.render_page()
+        elif url.path == '/flats/':
+            try:
+                page = int(parse_qs(url.query).get('page', ['1'])[0])
+            except ValueError:
+                self.send_error(400, 'Wrong page number')
+                return
+            body = site.render_rows(page)
+            headers['X-Last-Page'] = '1' if page >= site.pages else '0'
+        else:
+            self.send_error(404)
+            return
+
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        site.requests.append((url.path, time.perf_counter() - started))
+
+    def log_message(self, format, *args) -> None:
+        """Keeps the server quiet, requests are recorded in `FakeForestClub.requests`"""
@@ -0,0 +1,111 @@
+#! /usr/bin/env python3
+
+"""Load test of the ForestClub scraper
+
+Runs the full `forestclub.main` pipeline several times in a row against the local
+fake website (see fake_site.py), with e-mails delivered to the local Gmail sink
+(see fake_gmail.py), and reports throughput and latency of every run.
+
+Requires Chrome, as the website is scraped with a real selenium web-driver.
+Launch from the repository root:
+
+    python3 -m tests.load.run_load --runs 5 --flats 500 --page-size 20 --latency 0.05
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from tabulate import tabulate
+from typing import List, Optional
+from unittest.mock import patch
+
+import forestclub
+from tests.load.fake_gmail import fake_gmail
+from tests.load.fake_site import FakeForestClub
+
+
+def run_load_test(runs: int = 3, flats: int = 100, page_size: int = 20, latency: float = 0.0,
+                  churn: float = 0.05, growth: int = 0, email_latency: float = 0.0,
+                  seed: Optional[int] = None) -> List[dict]:
+    """Runs `forestclub.main` `runs` times against the fake website,
+    changing the offer between runs, and returns measurements of every run
+    """
+
+    results = []
+    scraped = []
+    webscrape_apartments = forestclub.webscrape_apartments
+
+    def recording_webscrape(link: str, headers: List[str]) -> List[dict]:
+        apartments = webscrape_apartments(link, headers)
+        scraped.append(apartments)
+        return apartments
+
+    cwd = os.getcwd()
+    with FakeForestClub(flats, page_size, latency, churn, growth, seed) as site, \
+            fake_gmail(email_latency) as gmail, \
+            tempfile.TemporaryDirectory() as work_dir, \
+            patch.dict(os.environ, {'FROM_EMAIL': 'scraper@example.com', 'TO_EMAIL': 'me@example.com'}), \
+            patch('forestclub._LINK', site.link), \
+            patch('forestclub.webscrape_apartments', recording_webscrape):
+        os.chdir(work_dir)  # csv files are saved in the current directory
+        try:
+            for run in range(1, runs + 1):
+                if run > 1:
+                    site.advance()
+                site.requests.clear()
+                emails_before = len(gmail.sent)
+
+                started = time.perf_counter()
+                forestclub.main()
+                elapsed = time.perf_counter() - started
+
+                request_times = [seconds for _, seconds in site.requests]
+                results.append({
+                    'run': run,
+                    'flats': len(scraped[-1]),
+                    'complete': scraped[-1] == site.apartments(),
+                    'requests': len(request_times),
+                    'request avg [ms]': 1000 * statistics.mean(request_times),
+                    'request max [ms]': 1000 * max(request_times),
+                    'run [s]': elapsed,
+                    'flats/s': len(scraped[-1]) / elapsed,
+                    'emails': len(gmail.sent) - emails_before,
+                })
+        finally:
+            os.chdir(cwd)
+
+    return results
+
+
+def main() -> None:
+    """Parses command line arguments, runs the load test and prints the results"""
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=3, help='number of scraper runs')
+    parser.add_argument('--flats', type=int, default=100, help='number of apartments on the website')
+    parser.add_argument('--page-size', type=int, default=20, help='apartments shown per "load more" click')
+    parser.add_argument('--latency', type=float, default=0.0, help='delay of every response [s]')
+    parser.add_argument('--churn', type=float, default=0.05,
+                        help='fraction of apartments changing status between runs')
+    parser.add_argument('--growth', type=int, default=0, help='new apartments added between runs')
+    parser.add_argument('--email-latency', type=float, default=0.0, help='delay of sending an e-mail [s]')
+    parser.add_argument('--seed', type=int, default=None, help='seed making the offer reproducible')
+    args = parser.parse_args()
+
+    results = run_load_test(args.runs, args.flats, args.page_size, args.latency,
+                            args.churn, args.growth, args.email_latency, args.seed)
+
+    print(tabulate([result.values() for result in results], headers=list(results[0].keys()),
+                   floatfmt='.2f'))
+
+    total_time = sum(result['run [s]'] for result in results)
+    total_flats = sum(result['flats'] for result in results)
+    print(f'\nTotal: {total_flats} apartments in {total_time:.2f} s '
+          f'({total_flats / total_time:.2f} apartments/s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+from unittest import TestCase
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from bs4 import BeautifulSoup
+
+import forestclub
+import my_gmail
+from tests.load.fake_gmail import fake_gmail, message_text
+from tests.load.fake_site import FakeForestClub
+
+_HEADERS = ['Apartment', 'Size', 'Rooms', 'Floor', 'Status', 'Link']
+
+
+class FakeForestClubTest(TestCase):
+    def test_pages_parsed_by_scraper(self):
+        """Tests if the search page and all subsequent pages together hold the whole offer"""
+
+        with FakeForestClub(flats=45, page_size=20, seed=1) as site:
+            html = urlopen(site.link).read().decode()
+            for page in range(2, site.pages + 1):
+                with urlopen(f'{site.url}/flats/?page={page}') as response:
+                    last_page = response.headers['X-Last-Page']
+                    html = html.replace('</tbody>', response.read().decode() + '</tbody>')
+
+            apartments = forestclub.find_apartments(BeautifulSoup(html, 'html.parser'), _HEADERS)
+
+            self.assertEqual(site.pages, 3)
+            self.assertEqual(last_page, '1')
+            self.assertListEqual(apartments, site.apartments())
+            self.assertEqual(len(site.requests), 3)
+
+    def test_load_more_button_hidden_for_single_page(self):
+        """Tests if the "load more" button is hidden when the whole offer fits on the first page"""
+
+        site = FakeForestClub(flats=5, page_size=20, seed=1)
+        soup = BeautifulSoup(site.render_page(), 'html.parser')
+        button = soup.find('button', {'class': 'load_more_offer'})
+
+        self.assertIn('display: none', button['style'])
+
+    def test_unknown_path(self):
+        """Tests if unknown paths are answered with 404"""
+
+        with FakeForestClub(flats=5, seed=1) as site:
+            with self.assertRaises(HTTPError) as error:
+                urlopen(f'{site.url}/unknown/')
+
+            self.assertEqual(error.exception.code, 404)
+
+    def test_advance(self):
+        """Tests if churn and growth change the offer between runs"""
+
+        site = FakeForestClub(flats=100, churn=0.1, growth=4, seed=1)
+        before = site.apartments()
+        site.advance()
+        after = site.apartments()
+
+        changed = [flat for flat in after[:100] if flat not in before]
+        self.assertEqual(len(after), 104)
+        self.assertEqual(len(changed), 10)
+        self.assertListEqual(after[:100], [dict(flat, Status=new['Status'])
+                                           for flat, new in zip(before, after)])
+
+    def test_same_seed_same_offer(self):
+        """Tests if the offer is reproducible for a given seed"""
+
+        self.assertListEqual(FakeForestClub(flats=30, seed=7).apartments(),
+                             FakeForestClub(flats=30, seed=7).apartments())
+
+
+class FakeGmailTest(TestCase):
+    def test_create_and_send_email(self):
+        """Tests if e-mail sent with my_gmail is delivered to the fake Gmail service"""
+
+        with fake_gmail() as gmail:
+            my_gmail.create_and_send_email('from@example.com', 'to@example.com',
+                                           '[ForestClub] Test', 'Some text')
+
+        self.assertEqual(len(gmail.sent), 1)
+        self.assertListEqual(gmail.subjects, ['[ForestClub] Test'])
+        self.assertEqual(gmail.sent[0]['to'], 'to@example.com')
+        self.assertEqual(message_text(gmail.sent[0]), 'Some text')